@@ -0,0 +1,25 @@
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Make ``uvloop`` the default asyncio event loop, if it is installed.
+
+    Call this once at startup, before the event loop is created. Returns
+    ``True`` if uvloop was installed and ``False`` if it is not available,
+    in which case the stock asyncio loop is left in place.
+
+    This sets the global event loop policy, an API deprecated as of Python
+    3.14 (where this call emits a ``DeprecationWarning``). On Python 3.12+
+    prefer selecting the loop where it is created instead, e.g.
+    ``uvloop.run(main())`` or
+    ``asyncio.Runner(loop_factory=uvloop.new_event_loop)``; this helper is
+    kept as a fallback for code that does not control loop creation.
+    """
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
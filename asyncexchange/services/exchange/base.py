@@ -1,7 +1,9 @@
+import asyncio
 import datetime as dt
-import xml.etree.ElementTree as ET
+from typing import AsyncIterator
 
 import httpx
+from lxml import etree as ET
 
 from asyncexchange.services.xml.email import EwsXmlHelper
 
@@ -10,6 +12,8 @@ class AsyncExchangeBaseService:
     """
     Base class for async services that talk to Exchange via EWS over HTTP.
     Provides HTTP client setup, timezone handling and a low-level EWS caller.
+
+    Running on uvloop is recommended; see ``asyncexchange.install_uvloop``.
     """
 
     def __init__(
@@ -26,34 +30,67 @@ class AsyncExchangeBaseService:
             base_url=server_url,
             auth=(self.username, self.password),
             timeout=10.0,
+            # Multiplex concurrent SOAP calls (e.g. the ResolveNames fan-out)
+            # over a single TLS connection.
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={"Content-Type": "text/xml; charset=utf-8"},
         )
         self.tz: dt.tzinfo = tz or dt.timezone(
             dt.timedelta(hours=0),
             "UTC",
         )
 
+        # legacyDN -> SMTP mappings are stable for the life of the process,
+        # so results (including misses) are cached, and concurrent lookups
+        # of the same entry share a single in-flight ResolveNames request.
+        self._resolve_cache: dict[str, str | None] = {}
+        self._resolve_inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._resolve_waiters: dict[str, int] = {}
+
     async def aclose(self) -> None:
         await self.client.aclose()
 
-    async def _post_ews(self, soap_action: str, body: str) -> ET.Element:
+    async def _post_ews(self, soap_action: str, body: ET._Element) -> bytes:
         """
         Perform a raw EWS SOAP call against the standard EWS endpoint:
         https://<server_url>/EWS/Exchange.asmx
+
+        Returns the raw response bytes; parsing is left to the
+        ``EwsXmlHelper.parse_*`` helpers so they can stream over it.
         """
         envelope = EwsXmlHelper.build_soap_envelope(body)
 
-        headers = {
-            "Content-Type": "text/xml; charset=utf-8",
-            "SOAPAction": soap_action,
-        }
+        headers = {"SOAPAction": soap_action}
 
         response = await self.client.post(
             "/EWS/Exchange.asmx",
-            content=envelope.encode("utf-8"),
+            content=envelope,
             headers=headers,
         )
         response.raise_for_status()
-        return ET.fromstring(response.text)
+        return response.content
+
+    async def _stream_ews(self, soap_action: str, body: ET._Element) -> AsyncIterator[bytes]:
+        """
+        Like ``_post_ews``, but yield the response body in chunks as it
+        arrives so it can be fed to an incremental parser.
+        """
+        envelope = EwsXmlHelper.build_soap_envelope(body)
+
+        headers = {"SOAPAction": soap_action}
+
+        async with self.client.stream(
+            "POST",
+            "/EWS/Exchange.asmx",
+            content=envelope,
+            headers=headers,
+        ) as response:
+            response.raise_for_status()
+            # No chunk_size: re-chunking would hold data back until a full
+            # chunk has been buffered, defeating incremental parsing.
+            async for chunk in response.aiter_bytes():
+                yield chunk
 
     async def resolve_email_address(self, unresolved_entry: str) -> str | None:
         """
@@ -62,13 +99,55 @@ class AsyncExchangeBaseService:
         ``ResolveNames`` operation.
 
         Returns the resolved SMTP address, or ``None`` if resolution
-        fails or no SMTP address is found.
+        fails or no SMTP address is found. Results are cached per service
+        instance.
         """
+        if unresolved_entry in self._resolve_cache:
+            return self._resolve_cache[unresolved_entry]
+
+        future = self._resolve_inflight.get(unresolved_entry)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_resolved_email_address(unresolved_entry))
+            self._resolve_inflight[unresolved_entry] = future
+            future.add_done_callback(
+                lambda done: self._store_resolved_email_address(unresolved_entry, done)
+            )
+
+        # Shield the shared request so one cancelled caller does not cancel
+        # it for everybody else waiting on the same entry; it is only
+        # cancelled once no caller is waiting for it any more.
+        self._resolve_waiters[unresolved_entry] = self._resolve_waiters.get(unresolved_entry, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            remaining = self._resolve_waiters.pop(unresolved_entry) - 1
+            if remaining:
+                self._resolve_waiters[unresolved_entry] = remaining
+            elif not future.done():
+                # Unmap the request before cancelling it so that a later
+                # caller starts a fresh lookup instead of awaiting this one.
+                if self._resolve_inflight.get(unresolved_entry) is future:
+                    del self._resolve_inflight[unresolved_entry]
+                future.cancel()
+
+    def _store_resolved_email_address(
+        self,
+        unresolved_entry: str,
+        future: asyncio.Future[str | None],
+    ) -> None:
+        # The entry may already map to a newer request if this one was
+        # cancelled; leave that one alone.
+        if self._resolve_inflight.get(unresolved_entry) is future:
+            del self._resolve_inflight[unresolved_entry]
+        if not future.cancelled() and future.exception() is None:
+            self._resolve_cache[unresolved_entry] = future.result()
+
+    async def _fetch_resolved_email_address(self, unresolved_entry: str) -> str | None:
         body = EwsXmlHelper.build_resolvenames_body(unresolved_entry)
 
-        root = await self._post_ews(
+        content = await self._post_ews(
             soap_action="http://schemas.microsoft.com/exchange/services/2006/messages/ResolveNames",
             body=body,
         )
 
-        return EwsXmlHelper.parse_resolvenames_response(root)
+        return EwsXmlHelper.parse_resolvenames_response(content)
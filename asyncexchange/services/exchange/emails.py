@@ -1,9 +1,14 @@
+import asyncio
 import datetime as dt
-from typing import Iterable, List
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable, List
 
 from asyncexchange.models.email import EmailMessage
 from asyncexchange.services.exchange.base import AsyncExchangeBaseService
-from asyncexchange.services.xml.email import EwsXmlHelper
+from asyncexchange.services.xml.email import FINDITEM_PAGE_SIZE, EwsXmlHelper
+
+# Maximum number of ItemChanges sent in a single UpdateItem request.
+_UPDATEITEM_BATCH_SIZE = 500
 
 
 class EmailService(AsyncExchangeBaseService):
@@ -35,37 +40,129 @@ class EmailService(AsyncExchangeBaseService):
         """
         Fetch messages from the Exchange server.
         """
-        # First, use FindItem to get message IDs and basic metadata.
-        body = EwsXmlHelper.build_finditem_body(start=start, end=end, is_read=is_read)
-        root = await self._post_ews(
+        result: List[EmailMessage] = []
+        async for page in self.iter_messages(start=start, end=end, is_read=is_read):
+            result.extend(page)
+        return result
+
+    async def iter_messages(
+        self,
+        *,
+        end: dt.datetime | None = None,
+        start: dt.datetime | None = None,
+        is_read: bool | None = None,
+        page_size: int = FINDITEM_PAGE_SIZE,
+    ) -> AsyncIterator[List[EmailMessage]]:
+        """
+        Fetch messages from the Exchange server page by page, yielding up
+        to ``page_size`` fully populated messages at a time.
+
+        The next ``FindItem`` page is requested while the current page's
+        ``GetItem`` details are being fetched.
+        """
+        offset = 0
+        basic_items, next_offset, includes_last = await self._find_items(
+            start=start, end=end, is_read=is_read, offset=offset, page_size=page_size
+        )
+
+        # Pages are driven by IncludesLastItemInRange, not by whether a page
+        # held any messages: a page may contain only meeting requests or
+        # other non-Message items. The offset check guards against a server
+        # that stops advancing.
+        while not includes_last and next_offset > offset:
+            offset = next_offset
+            page_task = None
+            try:
+                async with asyncio.TaskGroup() as group:
+                    if basic_items:
+                        page_task = group.create_task(self._get_items(basic_items))
+                    find_task = group.create_task(
+                        self._find_items(
+                            start=start, end=end, is_read=is_read, offset=offset, page_size=page_size
+                        )
+                    )
+            except BaseExceptionGroup as exc_group:
+                # Surface the underlying error, as a sequential fetch would.
+                raise exc_group.exceptions[0]
+
+            if page_task is not None:
+                yield page_task.result()
+            basic_items, next_offset, includes_last = find_task.result()
+
+        if basic_items:
+            yield await self._get_items(basic_items)
+
+    async def _find_items(
+        self,
+        *,
+        end: dt.datetime | None,
+        start: dt.datetime | None,
+        is_read: bool | None,
+        offset: int,
+        page_size: int,
+    ) -> tuple[List[EmailMessage], int, bool]:
+        """
+        Use FindItem to get message IDs and basic metadata for one page.
+        """
+        body = EwsXmlHelper.build_finditem_body(
+            start=start,
+            end=end,
+            is_read=is_read,
+            offset=offset,
+            max_entries=page_size,
+        )
+        content = await self._post_ews(
             soap_action="http://schemas.microsoft.com/exchange/services/2006/messages/FindItem",
             body=body,
         )
-        basic_items = EwsXmlHelper.parse_finditem_response(root)
-
-        # If nothing was found, return early.
-        if not basic_items:
-            return []
+        return EwsXmlHelper.parse_finditem_page(content, offset)
 
-        # Then, use GetItem to fetch full details (recipients, body, etc.)
+    async def _get_items(self, basic_items: List[EmailMessage]) -> List[EmailMessage]:
+        """
+        Use GetItem to fetch full details (recipients, body, etc.) and
+        resolve author/recipient addresses to SMTP.
+        """
         getitem_body = EwsXmlHelper.build_getitem_body(basic_items)
-        root = await self._post_ews(
+
+        # Schedule ResolveNames for every distinct author/recipient as soon
+        # as its message has been parsed. The GetItem body is parsed while it
+        # streams in, so these lookups run while the rest is still arriving.
+        resolve_tasks: dict[str, asyncio.Task[str | None]] = {}
+        result: List[EmailMessage] = []
+        chunks = self._stream_ews(
             soap_action="http://schemas.microsoft.com/exchange/services/2006/messages/GetItem",
             body=getitem_body,
         )
-        result = EwsXmlHelper.parse_getitem_response(root)
+        try:
+            async with aclosing(chunks):
+                async for item in EwsXmlHelper.aiter_getitem_response(chunks):
+                    result.append(item)
+                    for mailbox in ([item.author] if item.author else []) + item.to_recipients:
+                        address = mailbox.email_address
+                        if address and address not in resolve_tasks:
+                            resolve_tasks[address] = asyncio.create_task(
+                                self.resolve_email_address(address)
+                            )
+
+            resolved_values = await asyncio.gather(*resolve_tasks.values())
+        except BaseException:
+            # Don't leave lookups running (or their errors unretrieved) once
+            # the caller has seen the failure.
+            for task in resolve_tasks.values():
+                task.cancel()
+            await asyncio.gather(*resolve_tasks.values(), return_exceptions=True)
+            raise
+        resolved_map = dict(zip(resolve_tasks, resolved_values))
+
         for item in result:
-            if item.author and item.author.email_address:
-                resolved = await self.resolve_email_address(item.author.email_address)
-                if resolved:
-                    item.author.email_address = resolved
+            if item.author and resolved_map.get(item.author.email_address):
+                item.author.email_address = resolved_map[item.author.email_address]
 
             for recipient in item.to_recipients:
-                if recipient.email_address:
-                    resolved = await self.resolve_email_address(recipient.email_address)
-                    if resolved:
-                        recipient.email_address = resolved
+                if resolved_map.get(recipient.email_address):
+                    recipient.email_address = resolved_map[recipient.email_address]
         return result
+
     async def mark_as_read(self, messages: Iterable[EmailMessage]) -> None:
         """
         Mark messages as read on the Exchange server.
@@ -74,9 +171,20 @@ class EmailService(AsyncExchangeBaseService):
         if not message_list:
             return
 
-        body = EwsXmlHelper.build_updateitem_body(message_list)
-
-        await self._post_ews(
-            soap_action="http://schemas.microsoft.com/exchange/services/2006/messages/UpdateItem",
-            body=body,
-        )
+        # Batch ItemChanges to stay clear of EWS throttling on very large
+        # selections; the batches are sent concurrently, and a failing batch
+        # cancels the others rather than leaving writes in flight.
+        try:
+            async with asyncio.TaskGroup() as group:
+                for i in range(0, len(message_list), _UPDATEITEM_BATCH_SIZE):
+                    group.create_task(
+                        self._post_ews(
+                            soap_action="http://schemas.microsoft.com/exchange/services/2006/messages/UpdateItem",
+                            body=EwsXmlHelper.build_updateitem_body(
+                                message_list[i : i + _UPDATEITEM_BATCH_SIZE]
+                            ),
+                        )
+                    )
+        except BaseExceptionGroup as exc_group:
+            # Surface the underlying error, as a sequential send would.
+            raise exc_group.exceptions[0]
@@ -1,17 +1,145 @@
 import datetime as dt
 import html as html_module
+import logging
 import re
-import xml.etree.ElementTree as ET
-from typing import Iterable, List
+from io import BytesIO
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from lxml import etree as ET
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:  # pragma: no cover - optional speedup
+    # Python 3.11+ accepts the trailing "Z" EWS uses natively.
+    parse_datetime = dt.datetime.fromisoformat
 
 from asyncexchange.models.email import EmailMessage, Mailbox
 
+logger = logging.getLogger(__name__)
+
 EWS_NS = {
     "s": "http://schemas.xmlsoap.org/soap/envelope/",
     "m": "http://schemas.microsoft.com/exchange/services/2006/messages",
     "t": "http://schemas.microsoft.com/exchange/services/2006/types",
 }
 
+# XML namespace map used when building request bodies.
+_BODY_NSMAP = {"m": EWS_NS["m"], "t": EWS_NS["t"]}
+
+# The SOAP envelope around the body never changes, so it is serialized once
+# at import time and only the body is serialized per request.
+_ENVELOPE_PREFIX = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<soap:Envelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    f' xmlns:m="{EWS_NS["m"]}"'
+    f' xmlns:t="{EWS_NS["t"]}"'
+    f' xmlns:soap="{EWS_NS["s"]}">'
+    "<soap:Header>"
+    '<t:RequestServerVersion Version="Exchange2013" />'
+    "</soap:Header>"
+    "<soap:Body>"
+).encode("utf-8")
+_ENVELOPE_SUFFIX = b"</soap:Body></soap:Envelope>"
+
+# Clark-notation ``{namespace}local`` names for every element we build.
+_QN = {
+    qname: f"{{{EWS_NS[prefix]}}}{local}"
+    for qname in (
+        "m:FindItem",
+        "m:GetItem",
+        "m:ResolveNames",
+        "m:UpdateItem",
+        "m:ItemShape",
+        "m:IndexedPageItemView",
+        "m:Restriction",
+        "m:ParentFolderIds",
+        "m:ItemIds",
+        "m:UnresolvedEntry",
+        "m:ItemChanges",
+        "t:BaseShape",
+        "t:AdditionalProperties",
+        "t:FieldURI",
+        "t:FieldURIOrConstant",
+        "t:Constant",
+        "t:And",
+        "t:IsEqualTo",
+        "t:IsGreaterThanOrEqualTo",
+        "t:IsLessThanOrEqualTo",
+        "t:DistinguishedFolderId",
+        "t:ItemId",
+        "t:ItemChange",
+        "t:Updates",
+        "t:SetItemField",
+        "t:Message",
+        "t:IsRead",
+    )
+    for prefix, local in [qname.split(":")]
+}
+
+# Default number of items requested per ``FindItem`` page.
+FINDITEM_PAGE_SIZE = 500
+
+_FINDITEM_FIELD_URIS = (
+    "item:Subject",
+    "message:IsRead",
+    "item:DateTimeSent",
+    "message:From",
+)
+_GETITEM_FIELD_URIS = (
+    *_FINDITEM_FIELD_URIS,
+    "message:ToRecipients",
+    "message:CcRecipients",
+    "message:BccRecipients",
+    "item:Body",
+)
+
+# Clark-notation ``{namespace}local`` tags for the elements we parse. lxml
+# compares these directly, with no per-lookup prefix/nsmap resolution.
+_T = EWS_NS["t"]
+_ROOT_FOLDER_TAG = f"{{{EWS_NS['m']}}}RootFolder"
+_ITEMS_TAG = f"{{{_T}}}Items"
+_MESSAGE_TAG = f"{{{_T}}}Message"
+_RESOLUTION_TAG = f"{{{_T}}}Resolution"
+_ITEM_ID_TAG = f"{{{_T}}}ItemId"
+_SUBJECT_TAG = f"{{{_T}}}Subject"
+_BODY_TAG = f"{{{_T}}}Body"
+_IS_READ_TAG = f"{{{_T}}}IsRead"
+_DT_SENT_TAG = f"{{{_T}}}DateTimeSent"
+_FROM_TAG = f"{{{_T}}}From"
+_TO_RECIPIENTS_TAG = f"{{{_T}}}ToRecipients"
+_MAILBOX_TAG = f"{{{_T}}}Mailbox"
+_EMAIL_ADDRESS_TAG = f"{{{_T}}}EmailAddress"
+_ROUTING_TYPE_TAG = f"{{{_T}}}RoutingType"
+
+
+def _mailbox_email(mailbox_el: ET._Element) -> ET._Element | None:
+    """
+    Return the ``<t:EmailAddress>`` child of a ``<t:Mailbox>``, if any.
+    """
+    return next(mailbox_el.iterchildren(_EMAIL_ADDRESS_TAG), None)
+
+
+def _release_element(elem: ET._Element) -> None:
+    """
+    Free an already-processed element and the siblings parsed before it.
+    """
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _iter_elements(content: bytes, tag: str | tuple[str, ...]) -> Iterator[ET._Element]:
+    """
+    Stream ``tag`` elements out of a raw SOAP response.
+
+    Each element is cleared (together with its already-processed siblings)
+    once the caller moves on, so memory stays bounded by a single element
+    rather than by the size of the whole response.
+    """
+    for _, elem in ET.iterparse(BytesIO(content), events=("end",), tag=tag, huge_tree=False):
+        yield elem
+        _release_element(elem)
+
 
 class EwsXmlHelper:
     """
@@ -43,22 +171,39 @@ class EwsXmlHelper:
         return cleaned
 
     @staticmethod
-    def build_soap_envelope(body: str) -> str:
-        """
-        Wrap a raw EWS body fragment into a full SOAP envelope.
-        """
-        return f"""<?xml version="1.0" encoding="utf-8"?>
-<soap:Envelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-               xmlns:m="http://schemas.microsoft.com/exchange/services/2006/messages"
-               xmlns:t="http://schemas.microsoft.com/exchange/services/2006/types"
-               xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
-  <soap:Header>
-    <t:RequestServerVersion Version="Exchange2013" />
-  </soap:Header>
-  <soap:Body>
-    {body}
-  </soap:Body>
-</soap:Envelope>"""
+    def build_soap_envelope(body: ET._Element) -> bytes:
+        """
+        Wrap a raw EWS body element into a full SOAP envelope and
+        serialize it as UTF-8 bytes.
+        """
+        return _ENVELOPE_PREFIX + ET.tostring(body, encoding="utf-8") + _ENVELOPE_SUFFIX
+
+    @staticmethod
+    def _build_field_comparison(
+        parent: ET._Element,
+        operator: str,
+        field_uri: str,
+        value: str,
+    ) -> None:
+        """
+        Append a ``<t:{operator}>`` restriction comparing ``field_uri``
+        against a constant ``value``.
+        """
+        comparison = ET.SubElement(parent, _QN[operator])
+        ET.SubElement(comparison, _QN["t:FieldURI"], FieldURI=field_uri)
+        constant = ET.SubElement(comparison, _QN["t:FieldURIOrConstant"])
+        ET.SubElement(constant, _QN["t:Constant"], Value=value)
+
+    @staticmethod
+    def _build_item_shape(parent: ET._Element, field_uris: Iterable[str]) -> None:
+        """
+        Append an ``IdOnly`` ``<m:ItemShape>`` requesting ``field_uris``.
+        """
+        item_shape = ET.SubElement(parent, _QN["m:ItemShape"])
+        ET.SubElement(item_shape, _QN["t:BaseShape"]).text = "IdOnly"
+        properties = ET.SubElement(item_shape, _QN["t:AdditionalProperties"])
+        for field_uri in field_uris:
+            ET.SubElement(properties, _QN["t:FieldURI"], FieldURI=field_uri)
 
     @staticmethod
     def build_finditem_body(
@@ -66,216 +211,261 @@ class EwsXmlHelper:
         end: dt.datetime | None = None,
         start: dt.datetime | None = None,
         is_read: bool | None = None,
-    ) -> str:
+        offset: int = 0,
+        max_entries: int = FINDITEM_PAGE_SIZE,
+    ) -> ET._Element:
         """
         Build the EWS ``FindItem`` request body for the Inbox with
+        the page of at most ``max_entries`` items starting at ``offset``.
         """
-        conditions: list[str] = []
-
-        # EWS "True" / "False" are capitalised strings.
-        if is_read is not None:
-            conditions.append(
-                f"""
-              <t:IsEqualTo>
-                <t:FieldURI FieldURI="message:IsRead" />
-                <t:FieldURIOrConstant>
-                  <t:Constant Value="{str(is_read).lower().capitalize()}" />
-                </t:FieldURIOrConstant>
-              </t:IsEqualTo>
-            """
-            )
-
-        if start is not None and end is not None:
-            conditions.append(
-                f"""
-              <t:And>
-                <t:IsGreaterThanOrEqualTo>
-                  <t:FieldURI FieldURI="item:DateTimeSent" />
-                  <t:FieldURIOrConstant>
-                    <t:Constant Value="{start.isoformat()}" />
-                  </t:FieldURIOrConstant>
-                </t:IsGreaterThanOrEqualTo>
-                <t:IsLessThanOrEqualTo>
-                  <t:FieldURI FieldURI="item:DateTimeSent" />
-                  <t:FieldURIOrConstant>
-                    <t:Constant Value="{end.isoformat()}" />
-                  </t:FieldURIOrConstant>
-                </t:IsLessThanOrEqualTo>
-              </t:And>
-            """
-            )
-
-        # If there is more than one condition, wrap them in a single <t:And>.
-        restriction_inner = ""
-        if conditions:
-            if len(conditions) == 1:
-                restriction_inner = conditions[0]
-            else:
-                restriction_inner = f"""
-              <t:And>
-                {''.join(conditions)}
-              </t:And>
-            """
-
-        restriction_block = ""
-        if restriction_inner:
-            restriction_block = f"""
-      <m:Restriction>
-        {restriction_inner}
-      </m:Restriction>
-      """
-
-        return f"""
-    <m:FindItem Traversal="Shallow">
-      <m:ItemShape>
-        <t:BaseShape>IdOnly</t:BaseShape>
-        <t:AdditionalProperties>
-          <t:FieldURI FieldURI="item:Subject" />
-          <t:FieldURI FieldURI="message:IsRead" />
-          <t:FieldURI FieldURI="item:DateTimeSent" />
-          <t:FieldURI FieldURI="message:From" />
-        </t:AdditionalProperties>
-      </m:ItemShape>
-      {restriction_block}
-      <m:ParentFolderIds>
-        <t:DistinguishedFolderId Id="inbox" />
-      </m:ParentFolderIds>
-    </m:FindItem>
-        """
+        root = ET.Element(_QN["m:FindItem"], nsmap=_BODY_NSMAP, Traversal="Shallow")
+        EwsXmlHelper._build_item_shape(root, _FINDITEM_FIELD_URIS)
+        ET.SubElement(
+            root,
+            _QN["m:IndexedPageItemView"],
+            MaxEntriesReturned=str(max_entries),
+            Offset=str(offset),
+            BasePoint="Beginning",
+        )
+
+        has_is_read = is_read is not None
+        has_range = start is not None and end is not None
+        if has_is_read or has_range:
+            restriction = ET.SubElement(root, _QN["m:Restriction"])
+            # If there is more than one condition, wrap them in a single <t:And>.
+            if has_is_read and has_range:
+                restriction = ET.SubElement(restriction, _QN["t:And"])
+
+            # EWS "True" / "False" are capitalised strings.
+            if has_is_read:
+                EwsXmlHelper._build_field_comparison(
+                    restriction, "t:IsEqualTo", "message:IsRead", str(is_read)
+                )
+
+            if has_range:
+                date_range = ET.SubElement(restriction, _QN["t:And"])
+                EwsXmlHelper._build_field_comparison(
+                    date_range, "t:IsGreaterThanOrEqualTo", "item:DateTimeSent", start.isoformat()
+                )
+                EwsXmlHelper._build_field_comparison(
+                    date_range, "t:IsLessThanOrEqualTo", "item:DateTimeSent", end.isoformat()
+                )
+
+        parent_folder_ids = ET.SubElement(root, _QN["m:ParentFolderIds"])
+        ET.SubElement(parent_folder_ids, _QN["t:DistinguishedFolderId"], Id="inbox")
+        return root
 
     @staticmethod
-    def build_getitem_body(messages: Iterable[EmailMessage]) -> str:
+    def build_getitem_body(messages: Iterable[EmailMessage]) -> ET._Element:
         """
         Build the EWS ``GetItem`` request body to fetch full message
         details (including recipients and body) for the given messages.
         """
-        item_ids_xml = ""
+        root = ET.Element(_QN["m:GetItem"], nsmap=_BODY_NSMAP)
+        EwsXmlHelper._build_item_shape(root, _GETITEM_FIELD_URIS)
+
+        item_ids = ET.SubElement(root, _QN["m:ItemIds"])
         for msg in messages:
             if not msg.id:
                 continue
-            change_key_attr = f' ChangeKey="{msg.change_key}"' if msg.change_key else ""
-            item_ids_xml += f"""
-      <t:ItemId Id="{msg.id}"{change_key_attr} />"""
-
-        return f"""
-    <m:GetItem>
-      <m:ItemShape>
-        <t:BaseShape>IdOnly</t:BaseShape>
-        <t:AdditionalProperties>
-          <t:FieldURI FieldURI="item:Subject" />
-          <t:FieldURI FieldURI="message:IsRead" />
-          <t:FieldURI FieldURI="item:DateTimeSent" />
-          <t:FieldURI FieldURI="message:From" />
-          <t:FieldURI FieldURI="message:ToRecipients" />
-          <t:FieldURI FieldURI="message:CcRecipients" />
-          <t:FieldURI FieldURI="message:BccRecipients" />
-          <t:FieldURI FieldURI="item:Body" />
-        </t:AdditionalProperties>
-      </m:ItemShape>
-      <m:ItemIds>
-        {item_ids_xml}
-      </m:ItemIds>
-    </m:GetItem>
-        """
+            item_id = ET.SubElement(item_ids, _QN["t:ItemId"], Id=msg.id)
+            if msg.change_key:
+                item_id.set("ChangeKey", msg.change_key)
+        return root
 
     @staticmethod
-    def build_resolvenames_body(unresolved_entry: str) -> str:
+    def build_resolvenames_body(unresolved_entry: str) -> ET._Element:
         """
         Build the EWS ``ResolveNames`` request body to resolve a legacy
         distinguished name (legacyDN/X.500) or other ambiguous value to
         a directory object (typically yielding an SMTP address).
         """
-        return f"""
-    <m:ResolveNames ReturnFullContactData="true" SearchScope="ActiveDirectory">
-      <m:UnresolvedEntry>{unresolved_entry}</m:UnresolvedEntry>
-    </m:ResolveNames>
+        root = ET.Element(
+            _QN["m:ResolveNames"],
+            nsmap=_BODY_NSMAP,
+            ReturnFullContactData="true",
+            SearchScope="ActiveDirectory",
+        )
+        ET.SubElement(root, _QN["m:UnresolvedEntry"]).text = unresolved_entry
+        return root
+
+    @staticmethod
+    def _parse_message(item: ET._Element) -> EmailMessage | None:
+        """
+        Internal helper to turn a single ``<t:Message>`` element into an
+        ``EmailMessage``. Returns ``None`` for items missing an id or
+        ``DateTimeSent``.
         """
+        # One sweep over the direct children; tags are already in
+        # ``{namespace}local`` form, so lookups are plain dict hits.
+        fields = {child.tag: child for child in item}
+        item_id_el = fields.get(_ITEM_ID_TAG)
+        subject_el = fields.get(_SUBJECT_TAG)
+        body_el = fields.get(_BODY_TAG)
+        is_read_el = fields.get(_IS_READ_TAG)
+        dt_sent_el = fields.get(_DT_SENT_TAG)
+
+        from_el = None
+        from_box = fields.get(_FROM_TAG)
+        if from_box is not None:
+            from_mailbox = next(from_box.iterchildren(_MAILBOX_TAG), None)
+            if from_mailbox is not None:
+                from_el = _mailbox_email(from_mailbox)
+
+        # Build the plain-address list and the Mailbox list in one walk.
+        to_recips: list[str] = []
+        to_mailboxes: list[Mailbox] = []
+        to_box = fields.get(_TO_RECIPIENTS_TAG)
+        if to_box is not None:
+            for mailbox_el in to_box.iterchildren(_MAILBOX_TAG):
+                email_el = _mailbox_email(mailbox_el)
+                if email_el is not None:
+                    address = email_el.text or ""
+                    to_recips.append(address)
+                    to_mailboxes.append(Mailbox.model_construct(email_address=address))
+
+        if item_id_el is None or dt_sent_el is None:
+            return None
+
+        author_email = from_el.text if from_el is not None and from_el.text else ""
+
+        body_text = (
+            body_el.text if body_el is not None and body_el.text else ""
+        )
+        body_type = (
+            body_el.attrib.get("BodyType", "").lower()
+            if body_el is not None
+            else ""
+        )
+        if body_type == "html":
+            html_body = body_text
+            text_body = EwsXmlHelper._html_to_text(body_text)
+        else:
+            html_body = ""
+            text_body = body_text
+
+        # Values come straight from the EWS response and already have the
+        # right types, so skip pydantic validation on this hot path.
+        return EmailMessage.model_construct(
+            id=item_id_el.attrib.get("Id", ""),
+            change_key=item_id_el.attrib.get("ChangeKey", ""),
+            subject=subject_el.text if subject_el is not None and subject_el.text else "",
+            text_body=text_body,
+            html_body=html_body,
+            datetime_sent=parse_datetime(dt_sent_el.text or ""),
+            is_read=is_read_el.text.lower() == "true" if is_read_el is not None and is_read_el.text else False,
+            from_=author_email or None,
+            to=to_recips or None,
+            author=Mailbox.model_construct(email_address=author_email) if author_email else None,
+            to_recipients=to_mailboxes,
+        )
 
     @staticmethod
-    def _parse_messages_common(root: ET.Element) -> List[EmailMessage]:
+    def _iter_messages_common(content: bytes) -> Iterator[EmailMessage]:
         """
         Internal helper to parse SOAP responses (``FindItem`` / ``GetItem``)
-        into a list of ``EmailMessage`` objects.
+        into ``EmailMessage`` objects, yielding each one as soon as its
+        ``<t:Message>`` element has been parsed.
         """
-        messages: List[EmailMessage] = []
+        for item in _iter_elements(content, _MESSAGE_TAG):
+            msg = EwsXmlHelper._parse_message(item)
+            if msg is not None:
+                yield msg
 
-        for item in root.findall(".//t:Message", EWS_NS):
-            item_id_el = item.find("t:ItemId", EWS_NS)
-            subject_el = item.find("t:Subject", EWS_NS)
-            body_el = item.find("t:Body", EWS_NS)
-            is_read_el = item.find("t:IsRead", EWS_NS)
-            dt_sent_el = item.find("t:DateTimeSent", EWS_NS)
-            from_el = item.find("t:From/t:Mailbox/t:EmailAddress", EWS_NS)
-            to_recips = [
-                e.text or ""
-                for e in item.findall(
-                    "t:ToRecipients/t:Mailbox/t:EmailAddress",
-                    EWS_NS,
-                )
-            ]
+    @staticmethod
+    def _parse_messages_common(content: bytes) -> List[EmailMessage]:
+        """
+        Internal helper to parse SOAP responses (``FindItem`` / ``GetItem``)
+        into a list of ``EmailMessage`` objects.
+        """
+        return list(EwsXmlHelper._iter_messages_common(content))
 
-            if item_id_el is None or dt_sent_el is None:
-                continue
+    @staticmethod
+    def parse_finditem_response(content: bytes) -> List[EmailMessage]:
+        """
+        Parse a ``FindItem`` SOAP response into a list of ``EmailMessage`` objects.
+        """
+        return EwsXmlHelper._parse_messages_common(content)
 
-            sent_raw = dt_sent_el.text or ""
-            if sent_raw.endswith("Z"):
-                sent_raw = sent_raw.replace("Z", "+00:00")
-
-            author_email = from_el.text if from_el is not None and from_el.text else ""
-
-            body_text = (
-                body_el.text if body_el is not None and body_el.text else ""
-            )
-            body_type = (
-                body_el.attrib.get("BodyType", "").lower()
-                if body_el is not None
-                else ""
-            )
-            if body_type == "html":
-                html_body = body_text
-                text_body = EwsXmlHelper._html_to_text(body_text)
+    @staticmethod
+    def parse_finditem_page(
+        content: bytes,
+        offset: int = 0,
+    ) -> tuple[List[EmailMessage], int, bool]:
+        """
+        Parse one page of a paged ``FindItem`` SOAP response requested at
+        ``offset``.
+
+        Returns the page's messages, the offset of the next page and whether
+        the page includes the last item in range (i.e. there are no further
+        pages to request). The next offset comes from the ``RootFolder``
+        ``IndexedPagingOffset`` attribute; if that is missing it is derived
+        from every item on the page, not just the ``<t:Message>`` ones, so
+        meeting requests and skipped messages still advance it.
+        """
+        messages: List[EmailMessage] = []
+        item_count = 0
+        next_offset: int | None = None
+        includes_last = True
+
+        for _, elem in ET.iterparse(
+            BytesIO(content),
+            events=("end",),
+            tag=(_MESSAGE_TAG, _ITEMS_TAG, _ROOT_FOLDER_TAG),
+            huge_tree=False,
+        ):
+            if elem.tag == _MESSAGE_TAG:
+                msg = EwsXmlHelper._parse_message(elem)
+                if msg is not None:
+                    messages.append(msg)
+                # Keep the emptied element so <t:Items> can still be counted.
+                elem.clear()
+            elif elem.tag == _ITEMS_TAG:
+                item_count = len(elem)
+                _release_element(elem)
             else:
-                html_body = ""
-                text_body = body_text
-
-            msg = EmailMessage(
-                id=item_id_el.attrib.get("Id", ""),
-                change_key=item_id_el.attrib.get("ChangeKey", ""),
-                subject=subject_el.text if subject_el is not None and subject_el.text else "",
-                text_body=text_body,
-                html_body=html_body,
-                datetime_sent=dt.datetime.fromisoformat(sent_raw),
-                is_read=is_read_el.text.lower() == "true" if is_read_el is not None and is_read_el.text else False,
-                from_=author_email or None,
-                to=to_recips or None,
-                author=Mailbox(email_address=author_email) if author_email else None,
-                to_recipients=[Mailbox(email_address=e) for e in to_recips],
-            )
-            messages.append(msg)
-
-        return messages
+                includes_last = elem.get("IncludesLastItemInRange", "true").lower() == "true"
+                paging_offset = elem.get("IndexedPagingOffset")
+                if paging_offset is not None:
+                    next_offset = int(paging_offset)
+
+        if next_offset is None:
+            next_offset = offset + item_count
+        return messages, next_offset, includes_last
 
     @staticmethod
-    def parse_finditem_response(root: ET.Element) -> List[EmailMessage]:
+    def parse_getitem_response(content: bytes) -> List[EmailMessage]:
         """
-        Parse a ``FindItem`` SOAP response into a list of ``EmailMessage`` objects.
+        Parse a ``GetItem`` SOAP response into a list of ``EmailMessage`` objects.
         """
-        return EwsXmlHelper._parse_messages_common(root)
+        return EwsXmlHelper._parse_messages_common(content)
 
     @staticmethod
-    def parse_getitem_response(root: ET.Element) -> List[EmailMessage]:
+    async def aiter_getitem_response(
+        chunks: AsyncIterable[bytes],
+    ) -> AsyncIterator[EmailMessage]:
         """
-        Parse a ``GetItem`` SOAP response into a list of ``EmailMessage`` objects.
+        Incrementally parse a ``GetItem`` SOAP response while it is still
+        being received, yielding each ``EmailMessage`` as soon as its
+        ``<t:Message>`` element is complete.
         """
-        return EwsXmlHelper._parse_messages_common(root)
+        parser = ET.XMLPullParser(events=("end",), tag=_MESSAGE_TAG)
+        async for chunk in chunks:
+            parser.feed(chunk)
+            for _, item in parser.read_events():
+                msg = EwsXmlHelper._parse_message(item)
+                _release_element(item)
+                if msg is not None:
+                    yield msg
+        parser.close()
 
     @staticmethod
-    def parse_resolvenames_response(root: ET.Element) -> str | None:
+    def parse_resolvenames_response(content: bytes) -> str | None:
         """
         Parse a ``ResolveNames`` SOAP response and return the first SMTP
         email address found, if any.
         """
-        print(root.text)
+        logger.debug("ResolveNames response: %s", content)
         # Typical structure:
         # <m:ResolveNamesResponseMessage>
         #   <m:ResolutionSet>
@@ -288,13 +478,13 @@ class EwsXmlHelper:
         #     </t:Resolution>
         #   </m:ResolutionSet>
         # </m:ResolveNamesResponseMessage>
-        for resolution in root.findall(".//t:Resolution", EWS_NS):
-            mailbox_el = resolution.find("t:Mailbox", EWS_NS)
+        for resolution in _iter_elements(content, _RESOLUTION_TAG):
+            mailbox_el = resolution.find(_MAILBOX_TAG)
             if mailbox_el is None:
                 continue
 
-            email_el = mailbox_el.find("t:EmailAddress", EWS_NS)
-            routing_el = mailbox_el.find("t:RoutingType", EWS_NS)
+            email_el = mailbox_el.find(_EMAIL_ADDRESS_TAG)
+            routing_el = mailbox_el.find(_ROUTING_TYPE_TAG)
 
             if email_el is None or not email_el.text:
                 continue
@@ -308,31 +498,25 @@ class EwsXmlHelper:
         return None
 
     @staticmethod
-    def build_updateitem_body(messages: Iterable[EmailMessage]) -> str:
+    def build_updateitem_body(messages: Iterable[EmailMessage]) -> ET._Element:
         """
         Build the EWS ``UpdateItem`` request body that marks the given
         messages as read.
         """
-        updates_xml = ""
+        root = ET.Element(
+            _QN["m:UpdateItem"],
+            nsmap=_BODY_NSMAP,
+            MessageDisposition="SaveOnly",
+            ConflictResolution="AutoResolve",
+        )
+        # A single <m:ItemChanges> holds one <t:ItemChange> per message.
+        item_changes = ET.SubElement(root, _QN["m:ItemChanges"])
         for msg in messages:
-            updates_xml += f"""
-        <m:ItemChanges>
-          <t:ItemChange>
-            <t:ItemId Id="{msg.id}" ChangeKey="{msg.change_key}" />
-            <t:Updates>
-              <t:SetItemField>
-                <t:FieldURI FieldURI="message:IsRead" />
-                <t:Message>
-                  <t:IsRead>true</t:IsRead>
-                </t:Message>
-              </t:SetItemField>
-            </t:Updates>
-          </t:ItemChange>
-        </m:ItemChanges>
-            """
-
-        return f"""
-    <m:UpdateItem MessageDisposition="SaveOnly" ConflictResolution="AutoResolve">
-      {updates_xml}
-    </m:UpdateItem>
-        """
+            item_change = ET.SubElement(item_changes, _QN["t:ItemChange"])
+            ET.SubElement(item_change, _QN["t:ItemId"], Id=msg.id, ChangeKey=msg.change_key)
+            updates = ET.SubElement(item_change, _QN["t:Updates"])
+            set_item_field = ET.SubElement(updates, _QN["t:SetItemField"])
+            ET.SubElement(set_item_field, _QN["t:FieldURI"], FieldURI="message:IsRead")
+            message = ET.SubElement(set_item_field, _QN["t:Message"])
+            ET.SubElement(message, _QN["t:IsRead"]).text = "true"
+        return root
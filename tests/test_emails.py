@@ -0,0 +1,350 @@
+import asyncio
+import datetime as dt
+import re
+
+import httpx
+import pytest
+
+from asyncexchange.models.email import EmailMessage
+from asyncexchange.services.exchange.emails import EmailService
+
+_NS = (
+    'xmlns:m="http://schemas.microsoft.com/exchange/services/2006/messages" '
+    'xmlns:t="http://schemas.microsoft.com/exchange/services/2006/types"'
+)
+
+
+def _envelope(inner: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">'
+        f"<s:Body>{inner}</s:Body></s:Envelope>"
+    ).encode("utf-8")
+
+
+def _message(item_id: str) -> str:
+    return (
+        f'<t:Message><t:ItemId Id="{item_id}" ChangeKey="ck-{item_id}" />'
+        f"<t:Subject>{item_id}</t:Subject>"
+        "<t:DateTimeSent>2024-01-01T10:00:00Z</t:DateTimeSent>"
+        "<t:IsRead>false</t:IsRead></t:Message>"
+    )
+
+
+def _meeting_request(item_id: str) -> str:
+    return f'<t:MeetingRequest><t:ItemId Id="{item_id}" ChangeKey="ck-{item_id}" /></t:MeetingRequest>'
+
+
+def _resolution(address: str | None) -> bytes:
+    resolution = (
+        "<t:Resolution><t:Mailbox>"
+        f"<t:EmailAddress>{address}</t:EmailAddress><t:RoutingType>SMTP</t:RoutingType>"
+        "</t:Mailbox></t:Resolution>"
+        if address
+        else ""
+    )
+    return _envelope(
+        f"<m:ResolveNamesResponse {_NS}><m:ResponseMessages><m:ResolveNamesResponseMessage>"
+        f"<m:ResolutionSet>{resolution}</m:ResolutionSet>"
+        "</m:ResolveNamesResponseMessage></m:ResponseMessages></m:ResolveNamesResponse>"
+    )
+
+
+def _inbox_transport(inbox: list[str], calls: list[str]) -> httpx.MockTransport:
+    """
+    Fake EWS endpoint serving FindItem pages out of ``inbox`` (item ids
+    starting with ``mr`` are meeting requests) and echoing GetItem ids back.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        action = request.headers["SOAPAction"].rsplit("/", 1)[-1]
+        body = request.content.decode("utf-8")
+        calls.append(action)
+
+        if action == "FindItem":
+            offset = int(re.search(r'Offset="(\d+)"', body).group(1))
+            max_entries = int(re.search(r'MaxEntriesReturned="(\d+)"', body).group(1))
+            page = inbox[offset : offset + max_entries]
+            next_offset = offset + len(page)
+            items = "".join(
+                _meeting_request(i) if i.startswith("mr") else _message(i) for i in page
+            )
+            return httpx.Response(
+                200,
+                content=_envelope(
+                    f"<m:FindItemResponse {_NS}><m:ResponseMessages><m:FindItemResponseMessage>"
+                    f'<m:RootFolder IndexedPagingOffset="{next_offset}" TotalItemsInView="{len(inbox)}" '
+                    f'IncludesLastItemInRange="{str(next_offset >= len(inbox)).lower()}">'
+                    f"<t:Items>{items}</t:Items></m:RootFolder>"
+                    "</m:FindItemResponseMessage></m:ResponseMessages></m:FindItemResponse>"
+                ),
+            )
+
+        if action == "GetItem":
+            ids = re.findall(r'ItemId Id="([^"]+)"', body)
+            messages = "".join(
+                f"<m:GetItemResponseMessage><m:Items>{_message(i)}</m:Items></m:GetItemResponseMessage>"
+                for i in ids
+            )
+            return httpx.Response(
+                200,
+                content=_envelope(
+                    f"<m:GetItemResponse {_NS}><m:ResponseMessages>{messages}"
+                    "</m:ResponseMessages></m:GetItemResponse>"
+                ),
+            )
+
+        return httpx.Response(500)
+
+    return httpx.MockTransport(handler)
+
+
+def _get_message_ids(inbox: list[str], page_size: int) -> list[str]:
+    async def run() -> list[str]:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = _inbox_transport(inbox, [])
+        try:
+            ids = []
+            async for page in service.iter_messages(page_size=page_size):
+                ids.extend(m.id for m in page)
+            return ids
+        finally:
+            await service.aclose()
+
+    return asyncio.run(run())
+
+
+def test_iter_messages_pages_through_inbox():
+    inbox = [f"id{i}" for i in range(1, 8)]
+    assert _get_message_ids(inbox, page_size=3) == inbox
+
+
+def test_iter_messages_non_message_items_do_not_repeat_messages():
+    inbox = ["id1", "mr1", "id2", "id3", "id4", "id5"]
+    assert _get_message_ids(inbox, page_size=2) == ["id1", "id2", "id3", "id4", "id5"]
+
+
+def test_iter_messages_continues_past_page_without_messages():
+    inbox = ["mr1", "mr2", "id1", "id2"]
+    assert _get_message_ids(inbox, page_size=2) == ["id1", "id2"]
+
+
+def test_iter_messages_raises_original_error_when_next_page_fails():
+    inbox = [f"id{i}" for i in range(1, 5)]
+    transport = _inbox_transport(inbox, [])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'Offset="2"' in request.content:
+            return httpx.Response(503)
+        return transport.handler(request)
+
+    async def run() -> None:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = httpx.MockTransport(handler)
+        try:
+            async for _ in service.iter_messages(page_size=2):
+                pass
+        finally:
+            await service.aclose()
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.response.status_code == 503
+
+
+def test_get_messages_cancels_pending_resolves_when_getitem_stream_fails():
+    resolve_cancelled = []
+
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield _envelope("")[:-len("</s:Body></s:Envelope>")] + (
+                f"<m:GetItemResponse {_NS}><m:ResponseMessages><m:GetItemResponseMessage><m:Items>"
+                '<t:Message><t:ItemId Id="id1" ChangeKey="ck" />'
+                "<t:DateTimeSent>2024-01-01T10:00:00Z</t:DateTimeSent>"
+                "<t:From><t:Mailbox><t:EmailAddress>/o=ORG/cn=a</t:EmailAddress></t:Mailbox></t:From>"
+                "</t:Message>"
+            ).encode("utf-8")
+            await asyncio.sleep(0)
+            raise httpx.ReadTimeout("stalled")
+
+    inbox_transport = _inbox_transport(["id1"], [])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        action = request.headers["SOAPAction"].rsplit("/", 1)[-1]
+        if action == "GetItem":
+            return httpx.Response(200, stream=BrokenStream())
+        if action == "ResolveNames":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                resolve_cancelled.append(request)
+                raise
+        return inbox_transport.handler(request)
+
+    async def run() -> None:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = httpx.MockTransport(handler)
+        try:
+            with pytest.raises(httpx.ReadTimeout):
+                await service.get_messages()
+            # Let the cancelled lookups unwind.
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert len(resolve_cancelled) == 1
+            assert not service._resolve_inflight
+            assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_resolve_after_cancelling_only_waiter_starts_fresh_lookup():
+    posts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        if len(posts) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, content=_resolution("user@example.com"))
+
+    async def run() -> None:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = httpx.MockTransport(handler)
+        try:
+            first = asyncio.create_task(service.resolve_email_address("/o=ORG/cn=user"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0)
+
+            second = asyncio.create_task(service.resolve_email_address("/o=ORG/cn=user"))
+            assert await second == "user@example.com"
+            assert first.cancelled()
+            assert len(posts) == 2
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def _unread_messages(count: int) -> list[EmailMessage]:
+    sent = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    return [EmailMessage(id=f"id{i}", change_key=f"ck{i}", datetime_sent=sent) for i in range(count)]
+
+
+def test_mark_as_read_batches_item_changes():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, content=_envelope(""))
+
+    async def run() -> None:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = httpx.MockTransport(handler)
+        try:
+            await service.mark_as_read(_unread_messages(1001))
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert len(bodies) == 3
+    assert all(body.count(b"<m:ItemChanges>") == 1 for body in bodies)
+    assert sorted(body.count(b"<t:ItemChange>") for body in bodies) == [1, 500, 500]
+
+
+def test_mark_as_read_cancels_other_batches_when_one_fails():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if b'Id="id0"' in request.content:
+            return httpx.Response(503)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request)
+            raise
+        return httpx.Response(200, content=_envelope(""))
+
+    async def run() -> None:
+        service = EmailService("user", "password", "https://exchange.example")
+        service.client._transport = httpx.MockTransport(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                await service.mark_as_read(_unread_messages(1001))
+            assert exc_info.value.response.status_code == 503
+            assert len(cancelled) == 2
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def _resolve_service(handler) -> EmailService:
+    service = EmailService("user", "password", "https://exchange.example")
+    service.client._transport = httpx.MockTransport(handler)
+    return service
+
+
+def test_concurrent_resolves_of_one_entry_share_one_request():
+    posts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=_resolution("user@example.com"))
+
+    async def run() -> None:
+        service = _resolve_service(handler)
+        try:
+            results = await asyncio.gather(
+                service.resolve_email_address("/o=ORG/cn=user"),
+                service.resolve_email_address("/o=ORG/cn=user"),
+            )
+            assert results == ["user@example.com", "user@example.com"]
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert len(posts) == 1
+
+
+def test_unresolved_entry_is_cached():
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        return httpx.Response(200, content=_resolution(None))
+
+    async def run() -> None:
+        service = _resolve_service(handler)
+        try:
+            assert await service.resolve_email_address("/o=ORG/cn=nobody") is None
+            assert await service.resolve_email_address("/o=ORG/cn=nobody") is None
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert len(posts) == 1
+
+
+def test_resolve_server_error_is_not_cached():
+    posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posts.append(request)
+        if len(posts) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=_resolution("user@example.com"))
+
+    async def run() -> None:
+        service = _resolve_service(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.resolve_email_address("/o=ORG/cn=user")
+            assert await service.resolve_email_address("/o=ORG/cn=user") == "user@example.com"
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert len(posts) == 2